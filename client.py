@@ -0,0 +1,97 @@
+import http.client
+import json
+import socket
+
+from service import HOST, PORT
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+
+    def __init__(self, path, timeout=None):
+        """
+        Initializes a UnixHTTPConnection-object, an HTTP connection over a Unix socket.
+
+        :param path: path of the Unix socket
+        :param timeout: timeout in seconds for blocking operations
+        """
+        super().__init__('localhost', timeout=timeout)
+        self.path = path
+
+    def connect(self):
+        """ Connects to the Unix socket instead of a TCP address. """
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.path)
+
+
+class ServiceError(Exception):
+    """ Raised when the solver service answers with an error. """
+
+
+class SolverClient:
+
+    def __init__(self, host=HOST, port=PORT, unix_path=None, timeout=60):
+        """
+        Initializes a SolverClient-object for talking to a running solver service.
+        The connection is kept alive between requests.
+
+        :param host: address of the service
+        :param port: port of the service
+        :param unix_path: path of a Unix socket, used instead of host and port when given
+        :param timeout: timeout in seconds for each request
+        """
+        if unix_path:
+            self.connection = UnixHTTPConnection(unix_path, timeout=timeout)
+        else:
+            self.connection = http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def request(self, path):
+        """
+        Sends a GET-request to the service.
+
+        :param path: requested path including the query string
+        :return: dict containing the decoded json-answer
+        """
+        self.connection.request('GET', path)
+        response = self.connection.getresponse()
+        body = json.loads(response.read())
+
+        if response.status != 200:
+            raise ServiceError(body.get('error', response.reason))
+        return body
+
+    def solve(self, circles):
+        """
+        Solves the given order of circles.
+
+        :param circles: list of ints, representing the order of the circles
+        :return: minimum number of moves required;
+                 sequence of actions that lead to a solution
+        """
+        body = self.request('/solve?circles=' + ','.join(str(x) for x in circles))
+        return body['min_moves'], body['actions']
+
+    def generate(self, length):
+        """
+        Creates a random level of given length, together with its solution.
+
+        :param length: number of circles
+        :return: list of ints representing the order of the circles;
+                 minimum number of moves required;
+                 sequence of actions that lead to a solution
+        """
+        body = self.request('/generate?length={}'.format(length))
+        return body['circles'], body['min_moves'], body['actions']
+
+    def stats(self):
+        """
+        Gets the counters of the service.
+
+        :return: dict containing the statistics of the service
+        """
+        return self.request('/stats')
+
+    def close(self):
+        """ Closes the connection to the service. """
+        self.connection.close()
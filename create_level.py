@@ -89,17 +89,27 @@ class Level:
 class CreateLevels:
 
     def __init__(self):
-        """ Initializes a MakeLevels-object. """
-        levels = dict()
+        """
+        Initializes a MakeLevels-object.
+        Permutations are only built when a length is first requested.
+        """
+        self.levels = dict()
 
-        # Gets all permutations of circles-list for each length of 4-8
-        for length in range(4, 9):
+    def get_perms(self, length):
+        """
+        Gets all permutations of the circles-list of given length,
+        except the one already in correct order.
+
+        :param length: number of circles
+        :return: list of tuples, each a permutation of the circles
+        """
+        if length not in self.levels:
             ordered = [x for x in range(length)]
             perm = list(itertools.permutations(ordered))
             del perm[0]  # Delete the perm already in correct order
-            levels[length] = perm   # Store perm in dict corresponding to length
+            self.levels[length] = perm   # Store perm in dict corresponding to length
 
-        self.levels = levels
+        return self.levels[length]
 
     def get_random(self, length):
         """
@@ -108,6 +118,6 @@ class CreateLevels:
         :param length: number of circles, proportional to difficulty of level
         :return: Level-object with random permutation of circles
         """
-        perm = self.levels[length]
+        perm = self.get_perms(length)
         seq = [x for x in random.choice(perm)]
         return Level(seq)
@@ -0,0 +1,83 @@
+import argparse
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from client import SolverClient
+from service import HOST, PORT
+
+
+def percentile(values, p):
+    """
+    Gets the p-th percentile of a list of values using the nearest-rank method.
+
+    :param values: sorted list of numbers
+    :param p: percentile between 0 and 100
+    :return: value at the p-th percentile
+    """
+    index = max(0, math.ceil(p / 100 * len(values)) - 1)
+    return values[min(index, len(values) - 1)]
+
+
+def positive_int(text):
+    """
+    Argument type for options that need at least one.
+
+    :param text: value given on the command line
+    :return: the value as int
+    """
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError("must be at least 1, got {}".format(value))
+    return value
+
+
+def main():
+    """ Main program for load-testing a running solver service. """
+    parser = argparse.ArgumentParser(description="Load test for the Tricky Circles solver service")
+    parser.add_argument('--host', default=HOST)
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--unix', help="connect to this Unix socket instead of TCP")
+    parser.add_argument('--requests', type=positive_int, default=2000, help="total number of requests")
+    parser.add_argument('--concurrency', type=positive_int, default=16, help="number of parallel clients")
+    parser.add_argument('--length', type=int, default=7, help="number of circles per level")
+    parser.add_argument('--distinct', type=int, default=200,
+                        help="number of distinct levels, fewer means more cache hits and coalescing")
+    args = parser.parse_args()
+
+    # Levels are drawn from a fixed pool so that identical requests occur
+    ordered = list(range(args.length))
+    pool = [random.sample(ordered, args.length) for _ in range(args.distinct)]
+    pool = [seq for seq in pool if seq != ordered] or [ordered[::-1]]
+
+    local = threading.local()   # One kept-alive connection per thread
+
+    def timed_solve(_):
+        if not hasattr(local, 'client'):
+            local.client = SolverClient(args.host, args.port, args.unix)
+        start = time.perf_counter()
+        local.client.solve(random.choice(pool))
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        latencies = sorted(executor.map(timed_solve, range(args.requests)))
+    elapsed = time.perf_counter() - start
+
+    print("Requests:    {}".format(args.requests))
+    print("Concurrency: {}".format(args.concurrency))
+    print("Elapsed:     {:.3f} s".format(elapsed))
+    print("Throughput:  {:.1f} req/s".format(args.requests / elapsed))
+    for p in (50, 90, 99, 99.9):
+        print("p{:<5}       {:.2f} ms".format(p, percentile(latencies, p) * 1000))
+    print("max          {:.2f} ms".format(latencies[-1] * 1000))
+
+    client = SolverClient(args.host, args.port, args.unix)
+    print("Service stats: {}".format(client.stats()))
+    client.close()
+
+
+if __name__ == '__main__':
+    main()
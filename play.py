@@ -1,8 +1,11 @@
+import time
+LAUNCH = time.perf_counter()  # Taken before the other imports, so that they count towards startup
+
 import pygame as pg
 from sys import exit
 from create_level import CreateLevels
 from solve import Solver
-from draw import Drawer
+from draw import Drawer, WHITE
 
 
 WIDTH = 800
@@ -14,22 +17,64 @@ BUTTON_SIZE = (BUTTON_WIDTH, BUTTON_HEIGHT)
 BUTTON_SMALL = (BUTTON_WIDTH / 2, BUTTON_HEIGHT)
 
 
+class StartupTimer:
+
+    def __init__(self, start):
+        """
+        Initializes a StartupTimer-object, which records the duration of each startup step.
+
+        :param start: perf_counter reading taken when the program was launched
+        """
+        self.start = start
+        self.last = self.start
+        self.steps = []
+
+    def mark(self, step):
+        """
+        Records the time passed since the previous step.
+
+        :param step: name of the step that just finished
+        """
+        now = time.perf_counter()
+        self.steps.append((step, now - self.last))
+        self.last = now
+
+    def report(self):
+        """ Prints the duration of each startup step and the total. """
+        print("Startup timings:")
+        for step, duration in self.steps:
+            print("  {:<20} {:7.1f} ms".format(step, duration * 1000))
+        print("  {:<20} {:7.1f} ms".format("total", (self.last - self.start) * 1000))
+
+
 def main():
     """ Main program for playing the game. """
-    pg.init()
+    timer = StartupTimer(LAUNCH)
+    timer.mark("imports")
+
+    # Only initialize the modules that are used, pg.init() also starts audio and joysticks
+    pg.display.init()
+    pg.font.init()
     clock = pg.time.Clock()
     fps = 60
     pg.display.set_caption('Tricky Circles')
     icon = pg.image.load('resources/icon.jpg')
     pg.display.set_icon(icon)
+    timer.mark("init")
 
-    # Create display
+    # Create display and show it right away
     screen = pg.display.set_mode(SCREEN_SIZE)
-
-    # Load resources such as wallpaper and fonts
-    bg = pg.image.load('resources/desert.jpg')
+    screen.fill(WHITE)
+    pg.display.update()
+    timer.mark("window")
+
+    # Load resources such as wallpaper and fonts that are needed for the first frame
+    # Converting once to the display format avoids a conversion on every blit
+    bg = pg.image.load('resources/desert.jpg').convert()
+    timer.mark("background")
     font = pg.font.Font('resources/western.ttf', 30)
-    font_big = pg.font.Font('resources/western.ttf', 50)
+    font_big = None     # Only used on the finish-screen, loaded when the first level is solved
+    timer.mark("font")
 
     # Create buttons
     space = 50  # Space in between action buttons: a, b, x
@@ -50,15 +95,21 @@ def main():
                '-': button_min, '+': button_plus, '?': button_info}
 
     # Create starting level
+    # Permutations are built per difficulty, only when first needed
     difficulty = 4  # Number of circles
     level_maker = CreateLevels()
     level = level_maker.get_random(difficulty)
+    timer.mark("level")
     solver = Solver(level)
     min_moves, _ = solver.solve()  # Minimum moves needed to solve level
+    timer.mark("solve")
 
     # Creates Drawer for drawing levels
     drawer = Drawer(screen, WIDTH, level)
     drawer.draw_level(font, bg, min_moves, buttons, animation=False)
+    pg.display.update()
+    timer.mark("first frame")
+    timer.report()
 
     auto_solve = False
 
@@ -66,6 +117,9 @@ def main():
 
         if level.circles == level.answer:  # Level is solved
 
+            if font_big is None:
+                font_big = pg.font.Font('resources/western.ttf', 50)
+
             # Draw finish-screen, depending on how level was solved
             if auto_solve:
                 new_level = drawer.draw_solved(font_big, "Try it yourself?")
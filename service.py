@@ -0,0 +1,342 @@
+import argparse
+import asyncio
+import json
+import os
+import stat
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import urlsplit, parse_qs
+
+from create_level import Level, CreateLevels
+from solve import Solver
+
+
+HOST = '127.0.0.1'
+PORT = 8765
+CACHE_SIZE = 100000
+MIN_CIRCLES = 4
+MAX_CIRCLES = 8
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           500: 'Internal Server Error'}
+
+
+def solve_circles(circles):
+    """
+    Solves a single Level-state, runs inside a worker process of the pool.
+
+    :param circles: tuple of ints, representing the order of the circles
+    :return: minimum number of moves required;
+             sequence of actions that lead to a solution
+    """
+    solver = Solver(Level(list(circles)))
+    return solver.solve()
+
+
+def parse_circles(text):
+    """
+    Parses and validates the circles given in a request.
+
+    :param text: comma separated ints, e.g. "2,0,3,1"
+    :return: tuple of ints, representing the order of the circles
+    """
+    try:
+        circles = tuple(int(x) for x in text.split(','))
+    except ValueError:
+        raise ValueError("circles must be comma separated integers")
+
+    if not MIN_CIRCLES <= len(circles) <= MAX_CIRCLES:
+        raise ValueError("number of circles must be between {} and {}".format(MIN_CIRCLES, MAX_CIRCLES))
+    if sorted(circles) != list(range(len(circles))):
+        raise ValueError("circles must be a permutation of 0..{}".format(len(circles) - 1))
+
+    return circles
+
+
+class SolverService:
+
+    def __init__(self, workers=None, cache_size=CACHE_SIZE):
+        """
+        Initializes a SolverService-object, which shares one level table,
+        one solution cache and one process pool between all clients.
+
+        :param workers: number of worker processes, defaults to the number of CPUs
+        :param cache_size: maximum number of solutions kept in the cache
+        """
+        self.level_maker = CreateLevels()
+        for length in range(MIN_CIRCLES, MAX_CIRCLES + 1):
+            self.level_maker.get_perms(length)  # Tables are built once for the lifetime of the service
+        self.workers = workers
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+
+        self.cache = OrderedDict()  # Least recently used solutions are evicted first
+        self.cache_size = cache_size
+        self.in_flight = dict()     # Maps circles to the Future of a running computation
+
+        self.started = time.time()
+        self.stats = {'requests': 0, 'solves': 0, 'generates': 0, 'cache_hits': 0,
+                      'coalesced': 0, 'computations': 0, 'errors': 0}
+
+    async def solve(self, circles):
+        """
+        Gets the solution for the given circles, from the cache when possible.
+        Identical concurrent requests wait for the same computation.
+
+        :param circles: tuple of ints, representing the order of the circles
+        :return: minimum number of moves required;
+                 sequence of actions that lead to a solution
+        """
+        if circles in self.cache:
+            self.stats['cache_hits'] += 1
+            self.cache.move_to_end(circles)
+            return self.cache[circles]
+
+        future = self.in_flight.get(circles)
+        if future is not None:
+            self.stats['coalesced'] += 1
+            return await asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        pool = self.pool
+        try:
+            future = loop.run_in_executor(pool, solve_circles, circles)
+        except BrokenProcessPool:
+            self.restart_pool(pool)
+            raise
+        self.in_flight[circles] = future
+        self.stats['computations'] += 1
+
+        # Runs even when the request that started the computation was cancelled,
+        # so that the result still ends up in the cache
+        def finish(done):
+            del self.in_flight[circles]
+            if done.cancelled():
+                return
+            if done.exception() is None:
+                self.cache[circles] = done.result()
+                if len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+            elif isinstance(done.exception(), BrokenProcessPool):
+                self.restart_pool(pool)
+
+        future.add_done_callback(finish)
+        return await asyncio.shield(future)
+
+    def restart_pool(self, pool):
+        """
+        Replaces a broken process pool, e.g. after a worker was killed.
+        A pool that was already replaced by an earlier request is left alone.
+
+        :param pool: the process pool that turned out to be broken
+        """
+        if self.pool is pool:
+            print("Process pool is broken, starting a new one")
+            self.pool = ProcessPoolExecutor(max_workers=self.workers)
+            pool.shutdown(wait=False)  # Pending work of a broken pool has already failed
+
+    async def handle_solve(self, query):
+        """
+        Handles the solve-endpoint: /solve?circles=2,0,3,1
+
+        :param query: dict of parsed query parameters
+        :return: dict that is sent to the client as json
+        """
+        self.stats['solves'] += 1
+        circles = parse_circles(query.get('circles', [''])[0])
+        n_moves, moves = await self.solve(circles)
+        return {'circles': list(circles), 'min_moves': n_moves, 'actions': moves}
+
+    async def handle_generate(self, query):
+        """
+        Handles the generate-endpoint: /generate?length=5
+        A random Level is created and solved.
+
+        :param query: dict of parsed query parameters
+        :return: dict that is sent to the client as json
+        """
+        self.stats['generates'] += 1
+        try:
+            length = int(query.get('length', [MIN_CIRCLES])[0])
+        except ValueError:
+            raise ValueError("length must be an integer")
+        if not MIN_CIRCLES <= length <= MAX_CIRCLES:
+            raise ValueError("length must be between {} and {}".format(MIN_CIRCLES, MAX_CIRCLES))
+
+        level = self.level_maker.get_random(length)
+        circles = tuple(level.circles)
+        n_moves, moves = await self.solve(circles)
+        return {'circles': list(circles), 'min_moves': n_moves, 'actions': moves}
+
+    async def handle_stats(self, query):
+        """
+        Handles the stats-endpoint: /stats
+
+        :param query: dict of parsed query parameters
+        :return: dict that is sent to the client as json
+        """
+        stats = dict(self.stats)
+        stats['cache_size'] = len(self.cache)
+        stats['in_flight'] = len(self.in_flight)
+        stats['uptime'] = round(time.time() - self.started, 3)
+        return stats
+
+    async def dispatch(self, method, target):
+        """
+        Routes a request to the corresponding endpoint.
+
+        :param method: HTTP method of the request
+        :param target: requested path including the query string
+        :return: HTTP status code; dict that is sent to the client as json
+        """
+        url = urlsplit(target)
+        routes = {'/solve': self.handle_solve,
+                  '/generate': self.handle_generate,
+                  '/stats': self.handle_stats}
+
+        handler = routes.get(url.path)
+        if handler is None:
+            return 404, {'error': "unknown endpoint {}".format(url.path)}
+        if method != 'GET':
+            return 405, {'error': "only GET is supported"}
+
+        try:
+            return 200, await handler(parse_qs(url.query))
+        except ValueError as e:
+            return 400, {'error': str(e)}
+        except asyncio.CancelledError:
+            raise   # Subclass of Exception before Python 3.8, must not become a 500
+        except Exception as e:
+            return 500, {'error': "{}: {}".format(type(e).__name__, e)}
+
+    async def handle_connection(self, reader, writer):
+        """
+        Serves HTTP/1.1 requests on a single connection, keeping it alive
+        until the client closes it or asks for it to be closed.
+
+        :param reader: StreamReader of the connection
+        :param writer: StreamWriter of the connection
+        """
+        try:
+            while True:
+                try:
+                    request_line = await reader.readline()
+                    if not request_line:
+                        break
+
+                    # Read headers, only the ones needed for keep-alive and the body are used
+                    headers = dict()
+                    while True:
+                        line = await reader.readline()
+                        if line in (b'\r\n', b'\n', b''):
+                            break
+                        name, _, value = line.decode('latin-1').partition(':')
+                        headers[name.strip().lower()] = value.strip()
+                except (ValueError, asyncio.LimitOverrunError):
+                    # A line exceeded the reader's limit, the rest of the request can not be read
+                    request_line, headers = None, dict()
+
+                self.stats['requests'] += 1
+
+                try:
+                    if request_line is None:
+                        raise ValueError
+                    method, target, version = request_line.decode('latin-1').split()
+                    length = int(headers.get('content-length', 0))
+                    if length < 0:
+                        raise ValueError
+                except ValueError:
+                    # The connection is closed, so an unread body does not matter
+                    if request_line is None:
+                        error = "request line or header line too long"
+                    else:
+                        error = "malformed request line or Content-Length header"
+                    status, body = 400, {'error': error}
+                    method, version = None, 'HTTP/1.0'
+                else:
+                    # Request bodies are not used, but must be consumed
+                    if length:
+                        await reader.readexactly(length)
+
+                    status, body = await self.dispatch(method, target)
+
+                if status != 200:
+                    self.stats['errors'] += 1
+
+                keep_alive = method is not None and version == 'HTTP/1.1' \
+                    and headers.get('connection', '').lower() != 'close'
+
+                payload = json.dumps(body).encode()
+                writer.write("HTTP/1.1 {} {}\r\n"
+                             "Content-Type: application/json\r\n"
+                             "Content-Length: {}\r\n"
+                             "Connection: {}\r\n\r\n".format(status, REASONS[status], len(payload),
+                                                            'keep-alive' if keep_alive else 'close').encode())
+                writer.write(payload)
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def close(self):
+        """ Cancels the computations that have not started yet and shuts down the process pool. """
+        # shutdown(cancel_futures=True) only exists from Python 3.9
+        for future in list(self.in_flight.values()):
+            future.cancel()
+        self.pool.shutdown()
+
+
+async def serve(host=HOST, port=PORT, unix_path=None, workers=None):
+    """
+    Starts the service and serves until it is cancelled.
+
+    :param host: address to listen on
+    :param port: port to listen on
+    :param unix_path: path of a Unix socket, used instead of host and port when given
+    :param workers: number of worker processes
+    """
+    service = SolverService(workers)
+
+    if unix_path:
+        # Only a socket left behind by an earlier run may be removed
+        if os.path.exists(unix_path):
+            if not stat.S_ISSOCK(os.stat(unix_path).st_mode):
+                raise FileExistsError("{} exists and is not a socket".format(unix_path))
+            os.remove(unix_path)
+        server = await asyncio.start_unix_server(service.handle_connection, unix_path)
+        print("Serving on unix socket {}".format(unix_path))
+    else:
+        server = await asyncio.start_server(service.handle_connection, host, port)
+        print("Serving on http://{}:{}".format(host, port))
+
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main():
+    """ Main program for running the solver service. """
+    parser = argparse.ArgumentParser(description="Local Tricky Circles solver service")
+    parser.add_argument('--host', default=HOST)
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--unix', help="serve on this Unix socket instead of TCP")
+    parser.add_argument('--workers', type=int, help="number of solver processes")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.workers))
+    except KeyboardInterrupt:
+        pass
+    except FileExistsError as e:
+        parser.error(str(e))
+
+
+if __name__ == '__main__':
+    main()